@@ -1,11 +1,12 @@
 """Shared pytest configuration and fixtures."""
 
-from unittest.mock import patch
-
 import pytest
 
+
 @pytest.fixture
 def mock_editable_build(tmp_path):
+    from unittest.mock import patch
+
     editable_dir = str(tmp_path / "uvs-editable")
     with (
         patch("uv_script.runner._build_editables") as mock_build,
@@ -27,8 +28,11 @@ def pytest_addoption(parser):
 
 def pytest_collection_modifyitems(config, items):
     if config.getoption("--run-integration"):
+        for item in items:
+            if item.get_closest_marker("integration"):
+                item.add_marker(pytest.mark.xdist_group(name=item.nodeid))
         return
     skip_integration = pytest.mark.skip(reason="needs --run-integration option")
     for item in items:
-        if "integration" in item.keywords:
+        if item.get_closest_marker("integration"):
             item.add_marker(skip_integration)
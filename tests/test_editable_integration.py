@@ -4,35 +4,98 @@ These tests create real Python packages on disk and run uv to verify
 editable install behaviour. They require a working uv installation.
 
 Run with: uv run pytest tests/ -v --run-integration
+
+Each test is an independent, subprocess-bound unit, so the suite can be
+spread across cores with pytest-xdist:
+
+    uv run pytest tests/ -n auto --dist loadgroup --run-integration
 """
 
 from __future__ import annotations
 
+import functools
+import os
+import shutil
 import subprocess
+import sys
 import textwrap
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
 pytestmark = pytest.mark.integration
 
+_PYPROJECT_TMPL = textwrap.dedent("""\
+    [project]
+    name = "uvscript-test-y"
+    version = "0.0.1"
+    requires-python = ">=3.12"
+    dependencies = {deps}
 
-@pytest.fixture
-def workspace(tmp_path):
-    """Create a workspace with packages X and Y, plus a local wheel index.
+    [build-system]
+    requires = ["uv_build>=0.8.7,<0.9.0"]
+    build-backend = "uv_build"
+""")
 
-    Layout:
-        workspace/
-          X/
-            pyproject.toml
-            src/uvscript_test_x/__init__.py   (MARKER = "editable")
-          Y/
-            pyproject.toml
-            src/uvscript_test_y/__init__.py
-          wheels/
-            uvscript_test_x-0.1.2-*.whl       (MARKER = "source")
+_UV_FINDLINKS_TMPL = textwrap.dedent("""\
+
+    [tool.uv]
+    no-index = true
+    find-links = ["{wheels_dir}"]
+""")
+
+_UV_PEP503_TMPL = textwrap.dedent("""\
+
+    [[tool.uv.index]]
+    name = "local"
+    url = "{index_url}"
+    default = true
+""")
+
+_TRAILER_TMPL = textwrap.dedent("""\
+
+    [tool.uvs]
+    editable = ["../X"]
+
+    [tool.uvs.scripts]
+    check = "python -c 'import uvscript_test_x; print(uvscript_test_x.MARKER)'"
+""")
+
+
+@pytest.fixture(scope="session")
+def uv_cache(tmp_path_factory):
+    """A uv cache directory shared by every uv invocation in the session."""
+    return tmp_path_factory.mktemp("uv-cache")
+
+
+@pytest.fixture(scope="session")
+def uv_env(uv_cache):
+    """Environment for uv subprocesses, pointed at the shared session cache.
+
+    UV_PYTHON defaults to the interpreter running the tests so uv skips
+    interpreter discovery on every invocation.
     """
-    # -- Package X --
-    x_dir = tmp_path / "X"
+    return {
+        "UV_PYTHON": sys.executable,
+        **os.environ,
+        "UV_CACHE_DIR": str(uv_cache),
+        "UV_NO_PROGRESS": "1",
+        "UV_PYTHON_DOWNLOADS": "never",
+        "UV_LINK_MODE": "hardlink",
+        "NO_COLOR": "1",
+    }
+
+
+@pytest.fixture(scope="session")
+def prebuilt_x_wheel(tmp_path_factory, uv_env):
+    """Build package X into a wheel once per session.
+
+    Returns the wheel path (containing MARKER = "source") and the X source
+    tree the wheel was built from.
+    """
+    root = tmp_path_factory.mktemp("prebuilt-x")
+    x_dir = root / "X"
     x_src = x_dir / "src" / "uvscript_test_x"
     x_src.mkdir(parents=True)
     (x_src / "__init__.py").write_text('MARKER = "source"\n')
@@ -47,33 +110,144 @@ def workspace(tmp_path):
         build-backend = "uv_build"
     """))
 
-    # Build X into a wheel (contains MARKER = "source")
-    wheels_dir = tmp_path / "wheels"
+    wheels_dir = root / "wheels"
     wheels_dir.mkdir()
+    _build_wheel(x_dir, wheels_dir, uv_env)
+
+    wheel_path = wheels_dir / "uvscript_test_x-0.1.2-py3-none-any.whl"
+    assert wheel_path.is_file(), f"Expected wheel not built: {wheel_path.name}"
+
+    return wheel_path, x_dir
+
+
+def _build_wheel(project_dir, wheels_dir, env):
+    """Build a wheel for project_dir into wheels_dir.
+
+    Calls the PEP 517 backend through ``build.ProjectBuilder`` when ``build``
+    and the project's build requirements are installed, skipping the ``uv``
+    frontend. Falls back to ``uv build`` otherwise.
+    """
+    try:
+        from build import BuildBackendException, ProjectBuilder
+    except ImportError:
+        pass
+    else:
+        builder = ProjectBuilder(project_dir)
+        try:
+            if not builder.check_dependencies("wheel"):
+                builder.build("wheel", wheels_dir)
+                return
+        except BuildBackendException:
+            pass
+
     result = subprocess.run(
         ["uv", "build", "--wheel", "--out-dir", str(wheels_dir)],
-        cwd=str(x_dir),
-        capture_output=True,
-        text=True,
+        cwd=str(project_dir),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        env=env,
+    )
+    assert result.returncode == 0, f"Failed to build wheel: {result.stderr}"
+
+
+@pytest.fixture(scope="session")
+def prebuilt_y_venv(tmp_path_factory, uv_env):
+    """Create an empty virtual environment for package Y once per session."""
+    venv_dir = tmp_path_factory.mktemp("prebuilt-y") / ".venv"
+    result = subprocess.run(
+        ["uv", "venv", str(venv_dir)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        env=uv_env,
     )
-    assert result.returncode == 0, f"Failed to build X wheel: {result.stderr}"
+    assert result.returncode == 0, f"Failed to create Y venv: {result.stderr}"
+
+    return venv_dir
+
+
+@pytest.fixture(scope="session")
+def _layout_template(tmp_path_factory, prebuilt_x_wheel, prebuilt_y_venv):
+    """Lay out the parts of the workspace that are identical for every test."""
+    wheel_path, x_template = prebuilt_x_wheel
+    root = tmp_path_factory.mktemp("layout")
+
+    shutil.copytree(x_template, root / "X")
+
+    wheels_dir = root / "wheels"
+    wheels_dir.mkdir()
+    shutil.copy(wheel_path, wheels_dir)
+
+    y_src = root / "Y" / "src" / "uvscript_test_y"
+    y_src.mkdir(parents=True)
+    (y_src / "__init__.py").write_text("")
+    shutil.copytree(prebuilt_y_venv, root / "Y" / ".venv", symlinks=True)
+
+    return root
+
 
-    # Create a PEP 503 simple repository pointing to the wheel
-    wheel_name = next(wheels_dir.glob("*.whl")).name
-    simple_dir = tmp_path / "simple" / "uvscript-test-x"
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def simple_index_url(tmp_path_factory, prebuilt_x_wheel):
+    """Serve a PEP 503 simple repository containing X over HTTP.
+
+    One server is started per session and shared by every test.
+    """
+    wheel_path, _ = prebuilt_x_wheel
+    root = tmp_path_factory.mktemp("index")
+
+    wheels_dir = root / "wheels"
+    wheels_dir.mkdir()
+    shutil.copy(wheel_path, wheels_dir)
+
+    wheel_name = wheel_path.name
+    simple_dir = root / "simple" / "uvscript-test-x"
     simple_dir.mkdir(parents=True)
     (simple_dir / "index.html").write_text(
         f'<a href="../../wheels/{wheel_name}">{wheel_name}</a>\n'
     )
 
-    # Now modify X's source so it differs from the wheel
-    (x_src / "__init__.py").write_text('MARKER = "editable"\n')
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/simple/"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
 
-    # -- Package Y --
-    y_dir = tmp_path / "Y"
-    y_src = y_dir / "src" / "uvscript_test_y"
-    y_src.mkdir(parents=True)
-    (y_src / "__init__.py").write_text("")
+
+@pytest.fixture
+def workspace(tmp_path, _layout_template):
+    """Create a workspace with packages X and Y, plus a local wheel index.
+
+    Layout:
+        workspace/
+          X/
+            pyproject.toml
+            src/uvscript_test_x/__init__.py   (MARKER = "editable")
+          Y/
+            .venv/                            (empty, created once per session)
+            pyproject.toml
+            src/uvscript_test_y/__init__.py
+          wheels/
+            uvscript_test_x-0.1.2-py3-none-any.whl  (MARKER = "source")
+    """
+    shutil.copytree(_layout_template, tmp_path, symlinks=True, dirs_exist_ok=True)
+
+    # Modify X's source so it differs from the wheel
+    (tmp_path / "X" / "src" / "uvscript_test_x" / "__init__.py").write_text(
+        'MARKER = "editable"\n'
+    )
 
     return tmp_path
 
@@ -83,59 +257,32 @@ def _write_y_pyproject(
     *,
     depend_on_x: bool,
     index_mode: str = "none",
+    index_url: str | None = None,
 ):
     """Write Y's pyproject.toml with configurable dependency and index settings.
 
     index_mode:
         "none"       — no index configured (uv uses default PyPI)
         "find-links" — flat wheel directory via [tool.uv] find-links
-        "pep503"     — local PEP 503 simple repository via [[tool.uv.index]]
+        "pep503"     — PEP 503 simple repository at index_url via [[tool.uv.index]]
     """
     y_dir = workspace / "Y"
     wheels_dir = workspace / "wheels"
-    simple_dir = workspace / "simple"
 
     deps = '["uvscript-test-x>=0.1.2"]' if depend_on_x else "[]"
 
     uv_section = ""
     if index_mode == "find-links":
-        uv_section = textwrap.dedent(f"""\
-
-            [tool.uv]
-            no-index = true
-            find-links = ["{wheels_dir}"]
-        """)
+        uv_section = _UV_FINDLINKS_TMPL.format(wheels_dir=wheels_dir)
     elif index_mode == "pep503":
-        index_url = simple_dir.as_uri()
-        uv_section = textwrap.dedent(f"""\
-
-            [[tool.uv.index]]
-            name = "local"
-            url = "{index_url}"
-            default = true
-        """)
-
-    (y_dir / "pyproject.toml").write_text(textwrap.dedent(f"""\
-        [project]
-        name = "uvscript-test-y"
-        version = "0.0.1"
-        requires-python = ">=3.12"
-        dependencies = {deps}
+        uv_section = _UV_PEP503_TMPL.format(index_url=index_url)
 
-        [build-system]
-        requires = ["uv_build>=0.8.7,<0.9.0"]
-        build-backend = "uv_build"
-    """) + uv_section + textwrap.dedent("""\
-
-        [tool.uvs]
-        editable = ["../X"]
-
-        [tool.uvs.scripts]
-        check = "python -c 'import uvscript_test_x; print(uvscript_test_x.MARKER)'"
-    """))
+    (y_dir / "pyproject.toml").write_text(
+        "".join([_PYPROJECT_TMPL.format(deps=deps), uv_section, _TRAILER_TMPL])
+    )
 
 
-def _run_with_editable(workspace):
+def _run_with_editable(workspace, env):
     """Run the command that uvs would generate: uv run --with-editable X ..."""
     y_dir = workspace / "Y"
     x_dir = workspace / "X"
@@ -147,61 +294,75 @@ def _run_with_editable(workspace):
             "import uvscript_test_x; print(uvscript_test_x.MARKER)",
         ],
         capture_output=True,
-        text=True,
+        encoding="utf-8",
+        errors="replace",
         cwd=str(y_dir),
+        env=env,
     )
 
 
 class TestEditableDependencyClash:
-    def test_editable_fails_when_dep_not_on_any_index(self, workspace):
-        """--with-editable cannot satisfy a declared dependency.
-
-        When Y depends on X but X is not on any index, uv fails with a
-        resolution error even though --with-editable points to a valid
-        X source tree. This proves --with-editable does not participate
-        in dependency resolution.
-        """
-        _write_y_pyproject(workspace, depend_on_x=True, index_mode="none")
-        result = _run_with_editable(workspace)
-
-        assert result.returncode != 0, (
-            "Expected uv to fail resolving dependency, but it succeeded. "
-            f"stdout={result.stdout!r}"
+    @pytest.mark.parametrize(
+        ("depend_on_x", "index_mode", "expect_success", "expected"),
+        [
+            # --with-editable cannot satisfy a declared dependency. When Y
+            # depends on X but X is not on any index, uv fails with a
+            # resolution error even though --with-editable points to a valid
+            # X source tree. This proves --with-editable does not participate
+            # in dependency resolution.
+            pytest.param(
+                True, "none", False, "was not found in the package registry",
+                id="fails_when_dep_not_on_any_index",
+            ),
+            # Control: when X is on a local index (find-links) AND
+            # --with-editable is given, the editable provides the live source.
+            pytest.param(
+                True, "find-links", True, "editable",
+                id="local_index_uses_editable",
+            ),
+            # A PEP 503 simple repository, closer to a real PyPI-like private
+            # index. The dependency is resolvable from the index, and
+            # --with-editable is also specified for the same package; the
+            # index version must not shadow the editable install.
+            pytest.param(
+                True, "pep503", True, "editable",
+                id="pep503_index",
+            ),
+            # Control: editable works when X is NOT in project dependencies.
+            pytest.param(
+                False, "none", True, "editable",
+                id="without_dependency",
+            ),
+        ],
+    )
+    def test_editable_dependency_clash(
+        self,
+        workspace,
+        uv_env,
+        simple_index_url,
+        depend_on_x,
+        index_mode,
+        expect_success,
+        expected,
+    ):
+        _write_y_pyproject(
+            workspace,
+            depend_on_x=depend_on_x,
+            index_mode=index_mode,
+            index_url=simple_index_url,
         )
-        assert "was not found in the package registry" in result.stderr
-
-    def test_editable_with_local_index_uses_editable(self, workspace):
-        """When X is on a local index AND --with-editable, editable wins.
-
-        This is a control showing that when the dependency CAN be resolved
-        (via find-links), --with-editable correctly provides the live source.
-        """
-        _write_y_pyproject(workspace, depend_on_x=True, index_mode="find-links")
-        result = _run_with_editable(workspace)
+        result = _run_with_editable(workspace, uv_env)
 
-        assert result.returncode == 0, f"uv run failed: {result.stderr}"
-        assert result.stdout.strip() == "editable"
-
-    def test_editable_with_pep503_index(self, workspace):
-        """Test with a PEP 503 simple repository (closer to a real PyPI-like index).
-
-        This simulates the user's real scenario: a private index that behaves
-        like PyPI. The dependency is resolvable from the index, and
-        --with-editable is also specified for the same package.
-        """
-        _write_y_pyproject(workspace, depend_on_x=True, index_mode="pep503")
-        result = _run_with_editable(workspace)
+        if not expect_success:
+            assert result.returncode != 0, (
+                "Expected uv to fail resolving dependency, but it succeeded. "
+                f"stdout={result.stdout!r}"
+            )
+            assert expected in result.stderr
+            return
 
         assert result.returncode == 0, f"uv run failed: {result.stderr}"
-        assert result.stdout.strip() == "editable", (
-            f"Expected editable source but got {result.stdout.strip()!r}. "
+        assert result.stdout.strip() == expected, (
+            f"Expected {expected} source but got {result.stdout.strip()!r}. "
             "The index version may have shadowed the editable install."
         )
-
-    def test_editable_without_dependency(self, workspace):
-        """Control: editable works when X is NOT in project dependencies."""
-        _write_y_pyproject(workspace, depend_on_x=False, index_mode="none")
-        result = _run_with_editable(workspace)
-
-        assert result.returncode == 0, f"uv run failed: {result.stderr}"
-        assert result.stdout.strip() == "editable"